@@ -0,0 +1,462 @@
+"""
+System Resource Monitor - Live overview of CPU, memory, disk, and top processes.
+Run once for a snapshot, or with --watch for a continuously refreshing view.
+"""
+
+import os
+import re
+import sys
+import heapq
+import time
+import platform
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from datetime import datetime
+
+import psutil
+
+# Optional: C-speed top-K selection over the process table when available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# /proc/<pid>/stat: pid, then the command name in parentheses (which may
+# itself contain spaces or parens, hence the greedy match), then the
+# space-separated numeric fields
+_STAT_RE = re.compile(rb'\d+ \((.*)\) (.*)', re.DOTALL)
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# The four /proc/meminfo fields the memory panel needs, in file order,
+# so one search pulls them all out of a single read
+_MEMINFO_RE = re.compile(
+    rb'MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)'
+    rb'.*?SwapTotal:\s+(\d+).*?SwapFree:\s+(\d+)', re.DOTALL)
+
+# Upper bound on cached /proc/<pid>/stat descriptors, kept well below
+# typical ulimit -n defaults
+_FD_CACHE_MAX = 256
+
+
+# One row of the process table. slots=True drops the per-instance
+# __dict__, which adds up when there are thousands of processes per
+# refresh.
+@dataclass(slots=True, frozen=True)
+class ProcessInfo:
+    pid: int
+    name: str
+    cpu_percent: float
+    memory_rss: int
+
+# psutil < 6.0 re-checks create_time() on every process yielded by
+# process_iter (a PID-reuse guard), which makes enumerating a few hundred
+# processes an order of magnitude slower. We rely on the 6.0 behaviour.
+if tuple(int(x) for x in psutil.__version__.split('.')[:2]) < (6, 0):
+    print("⚠️  psutil >= 6.0 is recommended — process listing will be "
+          "much slower on older versions.")
+
+
+class SystemMonitor:
+    def __init__(self, top_n=10, proc_sample_period=1.0):
+        self.top_n = top_n
+        # Minimum seconds between full process passes; within that window
+        # get_top_processes serves the previous result, so the display can
+        # refresh faster than the (comparatively heavy) sampling runs
+        self.proc_sample_period = proc_sample_period
+        self._proc_sample_ts = 0.0
+        self._proc_sample = []
+        # (pid, create_time) -> cumulative cpu seconds from the previous
+        # call, so CPU% can be computed from a single pass
+        self._cpu_cache = {}
+        # System-wide cumulative CPU seconds from the previous call; snapshot
+        # once per refresh so per-process shares don't each re-read /proc/stat
+        self._sys_cpu_prev = None
+        # pid -> psutil.Process, reused across refreshes so --watch doesn't
+        # rebuild every Process object (and re-fetch its identity) each tick
+        self._proc_cache = {}
+        self.system = platform.system()
+        # Only Windows process names carry the .exe suffix worth stripping
+        self._strip_exe = self.system == 'Windows'
+        if self.system == 'Linux':
+            self._clock_ticks = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGESIZE')
+            # Reused for every /proc read so the sampling loop doesn't
+            # allocate a fresh buffer per process
+            self._read_buf = bytearray(2048)
+            # pid -> open /proc/<pid>/stat fd; procfs allows re-reading a
+            # kept-open stat file via pread at offset 0, so in --watch mode
+            # a warm pid costs one syscall per tick instead of three
+            self._stat_fds = {}
+        # Platform string, core count, and boot time never change while the
+        # monitor runs, so resolve them once instead of on every refresh
+        # (platform.platform() in particular is surprisingly expensive)
+        boot = datetime.fromtimestamp(psutil.boot_time())
+        self._sys_info = {
+            'platform': platform.platform(),
+            'hostname': platform.node(),
+            'cpu_count': psutil.cpu_count(logical=True),
+            'boot_time': boot.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        # Establish the baseline for non-blocking per-core readings
+        psutil.cpu_percent(interval=None, percpu=True)
+
+
+    # Static facts about the machine, resolved once at init
+    def get_system_info(self):
+        return self._sys_info
+
+
+    # Overall and per-core CPU utilisation. Only the first call blocks;
+    # the per-core read uses interval=None, which diffs against the
+    # previous reading instead of sleeping another 100 ms.
+    def get_cpu_info(self):
+        overall = psutil.cpu_percent(interval=0.1)
+        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        return {'overall': overall, 'per_core': per_core}
+
+
+    # RAM and swap usage. On Linux both live in /proc/meminfo, which
+    # psutil.virtual_memory and psutil.swap_memory would each open and
+    # parse separately — one read and one regex covers the lot.
+    def get_memory_info(self):
+        if self.system == 'Linux':
+            try:
+                with open('/proc/meminfo', 'rb') as f:
+                    match = _MEMINFO_RE.search(f.read())
+            except OSError:
+                match = None
+            if match:
+                total, avail, swap_total, swap_free = \
+                    (int(g) * 1024 for g in match.groups())
+                used = total - avail
+                swap_used = swap_total - swap_free
+                return {
+                    'total': total,
+                    'used': used,
+                    'available': avail,
+                    'percent': round(used / total * 100, 1) if total else 0.0,
+                    'swap_total': swap_total,
+                    'swap_used': swap_used,
+                    'swap_percent': (round(swap_used / swap_total * 100, 1)
+                                     if swap_total else 0.0),
+                }
+
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return {
+            'total': mem.total,
+            'used': mem.used,
+            'available': mem.available,
+            'percent': mem.percent,
+            'swap_total': swap.total,
+            'swap_used': swap.used,
+            'swap_percent': swap.percent,
+        }
+
+
+    # Usage for every mounted partition. Probes run in parallel threads
+    # (statvfs releases the GIL) so one slow network mount or spun-down
+    # drive doesn't serialize behind the others, and a 1 s overall
+    # deadline keeps a hung mount from freezing the display.
+    def get_disk_info(self):
+        partitions = psutil.disk_partitions()
+        if not partitions:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(8, len(partitions)))
+        futures = [executor.submit(psutil.disk_usage, p.mountpoint)
+                   for p in partitions]
+        executor.shutdown(wait=False)
+
+        disks = []
+        deadline = time.monotonic() + 1.0
+        for part, future in zip(partitions, futures):
+            try:
+                usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                future.cancel()
+                continue
+            except (PermissionError, OSError):
+                continue
+            disks.append({
+                'mountpoint': part.mountpoint,
+                'total': usage.total,
+                'used': usage.used,
+                'percent': usage.percent,
+            })
+        return disks
+
+
+    # Top N processes by CPU usage.
+    # Per-process attribute reads are wrapped in oneshot() so psutil fetches
+    # the underlying /proc (or NT) data once per process instead of once per
+    # attribute, roughly halving the syscall count of this pass.
+    #
+    # CPU% is computed from a single pass: we read each process's cumulative
+    # cpu_times() and diff it against the value cached on the previous call,
+    # instead of priming cpu_percent and sleeping 0.5 s between two passes.
+    # In --watch mode this makes each refresh essentially free of built-in
+    # latency.
+    def get_top_processes(self, n=None):
+        if n is None:
+            n = self.top_n
+
+        # Serve the cached list while it is fresh enough
+        if time.monotonic() - self._proc_sample_ts < self.proc_sample_period:
+            return self._proc_sample[:n]
+
+        first_call = not self._cpu_cache
+
+        # One system-wide snapshot per refresh; Process.cpu_percent would
+        # re-read the system CPU times once per PID, which is pure overhead
+        sys_total = sum(psutil.cpu_times())
+        sys_prev = self._sys_cpu_prev
+        self._sys_cpu_prev = sys_total
+        sys_delta = sys_total - sys_prev if sys_prev is not None else 0.0
+
+        new_cache = {}
+        processes = []
+        strip_exe = self._strip_exe
+        for pid, name, mem_rss, cpu_total, ident in self._sample_processes():
+            key = (pid, ident)
+            new_cache[key] = cpu_total
+
+            prev = self._cpu_cache.get(key)
+            if prev is None or sys_delta <= 0:
+                cpu = 0.0
+            else:
+                # Share of total machine capacity, so the column sums to
+                # at most ~100% regardless of core count
+                cpu = (cpu_total - prev) / sys_delta * 100
+
+            if strip_exe and name[-4:] == '.exe':
+                name = name[:-4]
+            processes.append(ProcessInfo(pid, name, cpu, mem_rss))
+
+        self._cpu_cache = new_cache
+
+        # A one-shot run has no previous sample to diff against, so take a
+        # quick second sample instead of reporting 0% for everything
+        if first_call:
+            time.sleep(0.1)
+            return self.get_top_processes(n)
+
+        if np is not None and len(processes) > n:
+            # Partial selection in C: argpartition pulls out the n largest
+            # CPU shares in O(N), then only those n get sorted
+            cpu_col = np.fromiter((p.cpu_percent for p in processes),
+                                  dtype=np.float64, count=len(processes))
+            idx = np.argpartition(-cpu_col, n)[:n]
+            idx = idx[np.argsort(-cpu_col[idx])]
+            top = [processes[i] for i in idx]
+        else:
+            # O(N log K) partial selection instead of sorting all N rows
+            top = heapq.nlargest(n, processes, key=lambda p: p.cpu_percent)
+
+        self._proc_sample = top
+        self._proc_sample_ts = time.monotonic()
+        return top[:n]
+
+
+    # Yields (pid, name, rss bytes, cumulative cpu seconds, identity) for
+    # every process, where identity disambiguates reused PIDs
+    def _sample_processes(self):
+        if self.system == 'Linux':
+            return self._sample_processes_linux()
+        return self._sample_processes_psutil()
+
+
+    # Linux fast path: read /proc/<pid>/stat directly instead of going
+    # through psutil's per-field wrappers — an order of magnitude cheaper
+    # when there are hundreds of processes. stat alone carries everything
+    # we display (name, utime+stime, rss), so it's one read per process.
+    def _sample_processes_linux(self):
+        ticks = self._clock_ticks
+        page = self._page_size
+        buf = self._read_buf
+        viewbuf = [buf]
+        samples = []
+        # Everything the loop body touches is hoisted to a local: global
+        # and attribute lookups cost a dict probe per access in CPython,
+        # and this loop runs once per PID per refresh
+        os_open = os.open
+        os_close = os.close
+        os_preadv = os.preadv
+        rdonly = os.O_RDONLY
+        stat_match = _STAT_RE.match
+        append = samples.append
+
+        # PIDs are the only top-level /proc entries starting with a digit,
+        # and scandir has already confirmed each one exists
+        with os.scandir('/proc') as it:
+            pids = [e.name for e in it if e.name[0].isdigit()]
+        fd_cache = self._stat_fds
+        for gone in set(fd_cache).difference(pids):
+            os_close(fd_cache.pop(gone))
+        cache_get = fd_cache.get
+
+        for entry in pids:
+            fd = cache_get(entry)
+            fresh = fd is None
+            try:
+                if fresh:
+                    fd = os_open('/proc/' + entry + '/stat', rdonly)
+                nread = os_preadv(fd, viewbuf, 0)
+            except OSError:
+                # Process exited between listing and reading (a cached fd
+                # for a reused PID lands here too and gets reopened next
+                # tick)
+                if fd is not None:
+                    fd_cache.pop(entry, None)
+                    os_close(fd)
+                continue
+            if fresh:
+                if len(fd_cache) < _FD_CACHE_MAX:
+                    fd_cache[entry] = fd
+                else:
+                    os_close(fd)
+            if nread == 0:
+                if cache_get(entry) == fd:
+                    os_close(fd_cache.pop(entry))
+                continue
+            match = stat_match(buf, 0, nread)
+            if not match:
+                continue
+            name = match.group(1).decode('utf-8', errors='replace')
+            # Fields after the command name: state is [0], so utime/stime
+            # land at [11]/[12], starttime (ticks since boot) at [19],
+            # and rss (resident pages) at [21]
+            fields = match.group(2).split()
+            cpu_total = (int(fields[11]) + int(fields[12])) / ticks
+            append((int(entry), name, int(fields[21]) * page,
+                    cpu_total, int(fields[19])))
+        return samples
+
+
+    # Portable path for non-Linux systems, with a reusable Process cache
+    def _sample_processes_psutil(self):
+        pids = psutil.pids()
+        proc_cache = self._proc_cache
+        for stale in set(proc_cache).difference(pids):
+            del proc_cache[stale]
+
+        samples = []
+        for pid in pids:
+            proc = proc_cache.get(pid)
+            if proc is None:
+                try:
+                    proc = psutil.Process(pid)
+                except (psutil.Error, OSError):
+                    continue
+                proc_cache[pid] = proc
+            try:
+                with proc.oneshot():
+                    name = proc.name()
+                    mem_rss = proc.memory_info().rss
+                    ct = proc.cpu_times()
+                    created = proc.create_time()
+            except (psutil.Error, OSError):
+                # Gone, access denied, or zombie — drop it and move on
+                proc_cache.pop(pid, None)
+                continue
+            samples.append((pid, name, mem_rss, ct.user + ct.system, created))
+        return samples
+
+
+    # Human-readable byte counts (1.5 GB, 320.0 MB, ...). The unit index
+    # comes straight from the bit length, so there's no divide loop — this
+    # runs a couple of times per row in the process table.
+    @staticmethod
+    def format_bytes(num_bytes):
+        i = min(max(int(num_bytes).bit_length() - 1, 0) // 10, len(_UNITS) - 1)
+        return f"{num_bytes / (1 << (10 * i)):.1f} {_UNITS[i]}"
+
+
+    # Draw a simple text progress bar
+    def make_bar(self, percent, width=20):
+        filled = int(width * percent / 100)
+        return "█" * filled + "░" * (width - filled)
+
+
+    # Build the whole frame as one string so each refresh is a single
+    # stdout write instead of ~30 print calls, each of which takes the
+    # stdout lock and can flush to the TTY on its own
+    def render(self):
+        info = self.get_system_info()
+        cpu = self.get_cpu_info()
+        mem = self.get_memory_info()
+        disks = self.get_disk_info()
+        procs = self.get_top_processes()
+
+        lines = []
+        add = lines.append
+        add("=" * 60)
+        add("🖥️  SYSTEM RESOURCE MONITOR")
+        add("=" * 60)
+        add(f"💻 {info['hostname']} — {info['platform']}")
+        add(f"⏰ Booted: {info['boot_time']}  |  CPUs: {info['cpu_count']}")
+
+        add("\n--- CPU ---")
+        add(f"Overall: [{self.make_bar(cpu['overall'])}] {cpu['overall']:.1f}%")
+        for i, core in enumerate(cpu['per_core']):
+            add(f"Core {i:2d}: [{self.make_bar(core)}] {core:.1f}%")
+
+        add("\n--- Memory ---")
+        add(f"RAM:  [{self.make_bar(mem['percent'])}] {mem['percent']:.1f}% "
+            f"({self.format_bytes(mem['used'])} / {self.format_bytes(mem['total'])})")
+        if mem['swap_total'] > 0:
+            add(f"Swap: [{self.make_bar(mem['swap_percent'])}] {mem['swap_percent']:.1f}% "
+                f"({self.format_bytes(mem['swap_used'])} / {self.format_bytes(mem['swap_total'])})")
+
+        add("\n--- Disks ---")
+        for disk in disks:
+            add(f"{disk['mountpoint']:<20} [{self.make_bar(disk['percent'])}] {disk['percent']:.1f}% "
+                f"({self.format_bytes(disk['used'])} / {self.format_bytes(disk['total'])})")
+
+        add(f"\n--- Top {len(procs)} Processes (by CPU) ---")
+        add(f"{'PID':>7} {'NAME':<25} {'CPU%':>6} {'MEM':>10}")
+        for p in procs:
+            add(f"{p.pid:>7} {p.name:<25.25} {p.cpu_percent:>5.1f}% "
+                f"{self.format_bytes(p.memory_rss):>10}")
+        add("=" * 60)
+        return "\n".join(lines) + "\n"
+
+
+    def monitor_once(self):
+        sys.stdout.write(self.render())
+        sys.stdout.flush()
+
+
+    def monitor_continuous(self, interval=2.0):
+        if os.name == 'nt':
+            os.system('')  # enables ANSI escape handling on Windows 10+
+        try:
+            while True:
+                # Clear + home + frame + footer go out as one write, so
+                # the repaint is a single syscall with no flicker between
+                # clearing and redrawing
+                frame = self.render()
+                sys.stdout.write(
+                    '\x1b[2J\x1b[H' + frame +
+                    f"(refreshing every {interval:.0f}s — Ctrl+C to quit)\n")
+                sys.stdout.flush()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\nGoodbye! 🖥️")
+
+
+def main():
+    monitor = SystemMonitor()
+
+    if len(sys.argv) > 1 and sys.argv[1] in ("--watch", "-w"):
+        monitor.monitor_continuous()
+    elif len(sys.argv) > 1:
+        print("Usage: python system_monitor.py [--watch]")
+        sys.exit(1)
+    else:
+        monitor.monitor_once()
+
+
+if __name__ == "__main__":
+    main()